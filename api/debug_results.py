@@ -11,6 +11,7 @@ Usage: python3 debug_results.py
 
 import json
 import sqlite3
+import zlib
 import requests
 from pathlib import Path
 
@@ -42,7 +43,11 @@ def check_database_results():
             
             if row['results']:
                 try:
-                    results = json.loads(row['results'])
+                    # Results are a zlib-compressed BLOB; older rows hold plain JSON text
+                    stored = row['results']
+                    if isinstance(stored, bytes):
+                        stored = zlib.decompress(stored)
+                    results = json.loads(stored)
                     print(f"   Results structure:")
                     
                     for key, value in results.items():
@@ -59,8 +64,8 @@ def check_database_results():
                         else:
                             print(f"     📊 {key}: {value}")
                             
-                except json.JSONDecodeError as e:
-                    print(f"   ❌ Results JSON parse error: {e}")
+                except (json.JSONDecodeError, UnicodeDecodeError, zlib.error) as e:
+                    print(f"   ❌ Results decode error: {e}")
             else:
                 print(f"   ⚠️  No results data")
                 
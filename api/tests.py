@@ -167,6 +167,42 @@ p cnf 20 91
         print(f"❌ Unexpected error: {e}")
         return False
 
+def test_invalid_metadata():
+    """Test that a test with non-strict JSON metadata (NaN) can be created, listed and read"""
+    print("🧪 Testing test with NaN metadata...")
+
+    try:
+        # Raw body: a bare NaN literal, as legacy rows stored it (requests won't encode NaN)
+        response = requests.post(
+            "http://localhost:8000/tests",
+            data='{"name": "test_nan_metadata", "chip_type": "LDPC", "metadata": {"snr": NaN}}',
+            headers={"Content-Type": "application/json"},
+            timeout=10
+        )
+        if response.status_code != 201:
+            print(f"❌ Create failed: {response.status_code}")
+            return False
+        test_id = response.json()["id"]
+
+        try:
+            list_response = requests.get("http://localhost:8000/tests", timeout=10)
+            detail_response = requests.get(f"http://localhost:8000/tests/{test_id}", timeout=10)
+            summaries_response = requests.get("http://localhost:8000/sat/test-summaries", timeout=10)
+        finally:
+            requests.delete(f"http://localhost:8000/tests/{test_id}", timeout=10)
+
+        for name, resp in [("List", list_response), ("Detail", detail_response), ("SAT summaries", summaries_response)]:
+            if resp.status_code != 200:
+                print(f"❌ {name} failed: {resp.status_code}")
+                return False
+
+        print("✅ NaN metadata test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+
 def test_api_health():
     """Test if the API is healthy"""
     try:
@@ -191,6 +227,8 @@ if __name__ == "__main__":
         print()
         # Run SATLIB test
         success = test_satlib_benchmark()
+        print()
+        success = test_invalid_metadata() and success
         
         if success:
             print("\n🎉 All tests passed! SATLIB integration is working.")